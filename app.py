@@ -1,136 +1,301 @@
 # app.py
 import streamlit as st
 import sqlite3
-import base64
+import binascii
 from PIL import Image
 import io
 import datetime
 import hashlib
 import os
+import threading
 
 # Database setup
 DB_FILE = "tanielu_family_story.db"
 
+# Serializes writes: Streamlit may run scripts from multiple threads against
+# the one shared connection below.
+DB_WRITE_LOCK = threading.Lock()
+
+@st.cache_resource
+def get_conn():
+    # One long-lived connection shared across reruns instead of an
+    # open/close per helper call. autocommit (isolation_level=None) so
+    # explicit commits aren't needed for reads.
+    conn = sqlite3.connect(DB_FILE, check_same_thread=False, isolation_level=None)
+    conn.row_factory = sqlite3.Row  # column-name access instead of positional unpacking
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-64000")
+    return conn
+
+# The whole schema in one script: one parse pass and one journal sync per
+# process launch instead of a dozen execute/commit round-trips.
+_DDL = '''
+BEGIN IMMEDIATE;
+
+CREATE TABLE IF NOT EXISTS users (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    email TEXT UNIQUE NOT NULL,
+    password TEXT NOT NULL,
+    role TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS photos (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT,
+    description TEXT,
+    date DATE,    -- ISO-8601 (YYYY-MM-DD) text: lexicographic order is chronological,
+                  -- so the (date, created_at) index sorts without any type conversion
+    location TEXT,
+    people TEXT,  -- legacy comma-separated user ids; superseded by photo_people
+    tags TEXT,    -- comma-separated tags
+    uploader_id INTEGER,
+    image_data BLOB,  -- raw JPEG bytes
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    thumb_data BLOB,  -- small JPEG for grid/list rendering
+    FOREIGN KEY (uploader_id) REFERENCES users(id)
+);
+
+-- Who's in each photo, normalized so lookups are indexed joins instead
+-- of substring matches on a CSV column.
+CREATE TABLE IF NOT EXISTS photo_people (
+    photo_id INTEGER,
+    user_id INTEGER,
+    PRIMARY KEY (photo_id, user_id),
+    FOREIGN KEY (photo_id) REFERENCES photos(id),
+    FOREIGN KEY (user_id) REFERENCES users(id)
+);
+
+-- Back the default ORDER BY so listing photos is an index walk, not a
+-- sort; idx_users_email covers the login/signup email lookups.
+CREATE INDEX IF NOT EXISTS idx_photos_date ON photos(date DESC, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_users_email ON users(email);
+
+-- Full-text index over the searchable photo columns, kept in sync by
+-- triggers so search_photos can use an inverted-index MATCH instead of
+-- five LIKE table scans.
+CREATE VIRTUAL TABLE IF NOT EXISTS photos_fts USING fts5(
+    title, description, location, tags, people,
+    content='photos', content_rowid='id'
+);
+
+CREATE TRIGGER IF NOT EXISTS photos_ai AFTER INSERT ON photos BEGIN
+    INSERT INTO photos_fts(rowid, title, description, location, tags, people)
+    VALUES (new.id, new.title, new.description, new.location, new.tags, new.people);
+END;
+
+CREATE TRIGGER IF NOT EXISTS photos_ad AFTER DELETE ON photos BEGIN
+    INSERT INTO photos_fts(photos_fts, rowid, title, description, location, tags, people)
+    VALUES ('delete', old.id, old.title, old.description, old.location, old.tags, old.people);
+END;
+
+CREATE TRIGGER IF NOT EXISTS photos_au AFTER UPDATE ON photos BEGIN
+    INSERT INTO photos_fts(photos_fts, rowid, title, description, location, tags, people)
+    VALUES ('delete', old.id, old.title, old.description, old.location, old.tags, old.people);
+    INSERT INTO photos_fts(rowid, title, description, location, tags, people)
+    VALUES (new.id, new.title, new.description, new.location, new.tags, new.people);
+END;
+
+COMMIT;
+'''
+
 def init_db():
-    conn = sqlite3.connect(DB_FILE)
+    conn = get_conn()
     c = conn.cursor()
-    # Users table
-    c.execute('''
-        CREATE TABLE IF NOT EXISTS users (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            email TEXT UNIQUE NOT NULL,
-            password TEXT NOT NULL,
-            role TEXT NOT NULL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    # Photos table
-    c.execute('''
-        CREATE TABLE IF NOT EXISTS photos (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT,
-            description TEXT,
-            date DATE,
-            location TEXT,
-            people TEXT,  -- comma-separated user ids
-            tags TEXT,    -- comma-separated tags
-            uploader_id INTEGER,
-            image_data TEXT,  -- base64 encoded image
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (uploader_id) REFERENCES users(id)
-        )
-    ''')
-    conn.commit()
+    with DB_WRITE_LOCK:
+        conn.executescript(_DDL)
+    # Schema v1+v2: image_data moved from base64 TEXT to raw BLOB (decoded
+    # in place -- SQLite columns are dynamically typed, so no table rebuild
+    # is needed) and the FTS index gained photos uploaded before it
+    # existed. The FTS rebuild must run before the BLOB rewrite: the
+    # UPDATEs fire the photos_au trigger, and FTS5 errors out 'deleting'
+    # a row it never indexed.
+    (schema_version,) = c.execute("PRAGMA user_version").fetchone()
+    if schema_version < 2:
+        with DB_WRITE_LOCK:
+            c.execute("INSERT INTO photos_fts(photos_fts) VALUES ('rebuild')")
+            if schema_version < 1:
+                old_rows = c.execute("SELECT id, image_data FROM photos WHERE typeof(image_data) = 'text'").fetchall()
+                for row_id, b64_data in old_rows:
+                    c.execute("UPDATE photos SET image_data = ? WHERE id = ?",
+                              (sqlite3.Binary(binascii.a2b_base64(b64_data)), row_id))
+            c.execute("PRAGMA user_version = 2")
+            conn.commit()
+    # Schema v3: persisted thumbnail column (ALTER appends, matching the
+    # column order in the CREATE TABLE above).
+    if schema_version < 3:
+        columns = [row[1] for row in c.execute("PRAGMA table_info(photos)")]
+        with DB_WRITE_LOCK:
+            if 'thumb_data' not in columns:
+                c.execute("ALTER TABLE photos ADD COLUMN thumb_data BLOB")
+            c.execute("PRAGMA user_version = 3")
+            conn.commit()
+    # Schema v4: copy the legacy people CSV into the junction table.
+    if schema_version < 4:
+        legacy = c.execute("SELECT id, people FROM photos WHERE people != ''").fetchall()
+        pairs = [(row['id'], int(x)) for row in legacy for x in row['people'].split(',') if x]
+        with DB_WRITE_LOCK:
+            c.executemany("INSERT OR IGNORE INTO photo_people (photo_id, user_id) VALUES (?, ?)", pairs)
+            c.execute("PRAGMA user_version = 4")
+            conn.commit()
     # Add demo accounts if not exist
     demo_users = [
         ('john@family.com', 'demo123', 'Dad'),
         ('mary@family.com', 'demo123', 'Mum'),
         ('sarah@family.com', 'demo123', 'Daughter')
     ]
-    for email, pw, role in demo_users:
-        hashed_pw = hashlib.sha256(pw.encode()).hexdigest()
-        try:
-            c.execute("INSERT INTO users (email, password, role) VALUES (?, ?, ?)", (email, hashed_pw, role))
-            conn.commit()
-        except sqlite3.IntegrityError:
-            pass  # Already exists
-    conn.close()
+    seed_rows = [(email, hashlib.sha256(pw.encode()).hexdigest(), role)
+                 for email, pw, role in demo_users]
+    with DB_WRITE_LOCK:
+        c.executemany("INSERT OR IGNORE INTO users (email, password, role) VALUES (?, ?, ?)", seed_rows)
+        conn.commit()
+    c.execute("PRAGMA optimize")
 
 init_db()
 
 # Helper functions
+_sha256 = hashlib.sha256  # local alias skips the attribute lookup on each call
+
+AUTH_STMT = "SELECT id, role FROM users WHERE email = ? AND password = ?"
+
 def hash_password(pw):
-    return hashlib.sha256(pw.encode()).hexdigest()
+    return _sha256(pw.encode()).hexdigest()
 
 def authenticate(email, pw):
-    conn = sqlite3.connect(DB_FILE)
-    c = conn.cursor()
-    hashed_pw = hash_password(pw)
-    c.execute("SELECT id, role FROM users WHERE email = ? AND password = ?", (email, hashed_pw))
-    user = c.fetchone()
-    conn.close()
-    return user
+    # One constant statement text, so sqlite3 reuses its compiled form
+    # across logins instead of re-preparing.
+    conn = get_conn()
+    return conn.execute(AUTH_STMT, (email, hash_password(pw))).fetchone()
 
+@st.cache_data(ttl=60)
 def get_all_users():
-    conn = sqlite3.connect(DB_FILE)
+    conn = get_conn()
     c = conn.cursor()
     c.execute("SELECT id, email, role FROM users")
-    users = c.fetchall()
-    conn.close()
-    return users
+    # Plain tuples, not sqlite3.Row: cache_data pickles its return value
+    # and Row objects aren't picklable.
+    return [tuple(row) for row in c.fetchall()]
+
+@st.cache_data(ttl=60)
+def get_people_options():
+    # email -> id, for the upload multiselect
+    return {email: uid for uid, email, role in get_all_users()}
+
+def clear_user_caches():
+    # Call after signup so new members show up without waiting out the ttl
+    get_all_users.clear()
+    get_people_options.clear()
+    get_family_role_map.clear()
 
 def save_photo(title, desc, date, loc, people, tags, uploader_id, image_data):
-    conn = sqlite3.connect(DB_FILE)
+    conn = get_conn()
     c = conn.cursor()
-    people_str = ','.join(map(str, people)) if people else ''
     tags_str = ','.join(tags) if tags else ''
-    c.execute('''
-        INSERT INTO photos (title, description, date, location, people, tags, uploader_id, image_data)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-    ''', (title, desc, date, loc, people_str, tags_str, uploader_id, image_data))
-    conn.commit()
-    conn.close()
-
-def get_all_photos():
-    conn = sqlite3.connect(DB_FILE)
-    c = conn.cursor()
-    c.execute("SELECT * FROM photos ORDER BY date DESC, created_at DESC")
-    photos = c.fetchall()
-    conn.close()
-    return photos
+    with DB_WRITE_LOCK:
+        c.execute("BEGIN")
+        c.execute('''
+            INSERT INTO photos (title, description, date, location, tags, uploader_id, image_data, thumb_data)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (title, desc, date, loc, tags_str, uploader_id,
+              sqlite3.Binary(image_data), sqlite3.Binary(resize_image(image_data, THUMB_SIZE, quality=THUMB_QUALITY))))
+        photo_id = c.lastrowid
+        if people:
+            c.executemany("INSERT OR IGNORE INTO photo_people (photo_id, user_id) VALUES (?, ?)",
+                          [(photo_id, user_id) for user_id in people])
+        conn.commit()
 
-def search_photos(query):
-    conn = sqlite3.connect(DB_FILE)
-    c = conn.cursor()
-    like_query = f"%{query}%"
-    c.execute('''
-        SELECT * FROM photos 
-        WHERE title LIKE ? OR description LIKE ? OR location LIKE ? OR tags LIKE ? OR people LIKE ?
-        ORDER BY date DESC, created_at DESC
-    ''', (like_query, like_query, like_query, like_query, like_query))
-    photos = c.fetchall()
-    conn.close()
-    return photos
-
-def get_user_by_id(user_id):
-    conn = sqlite3.connect(DB_FILE)
+PAGE_SIZE = 12
+
+def get_photos_page(offset, limit=PAGE_SIZE, query=None):
+    # One page of photos at a time so per-rerun work is bounded by the
+    # page size, not the size of the whole album.
+    # image_data is deliberately left out: it dwarfs every other column,
+    # so list rendering fetches metadata (plus the small thumbnail) and
+    # photo_image() pulls the full bytes only where they're shown.
+    meta_cols = '''p.id, p.title, p.description, p.date, p.location,
+                   p.tags, p.uploader_id, p.created_at, p.thumb_data, u.email, u.role'''
+    conn = get_conn()
     c = conn.cursor()
-    c.execute("SELECT email, role FROM users WHERE id = ?", (user_id,))
-    user = c.fetchone()
-    conn.close()
-    return user
+    if query:
+        # Quote the user's text so FTS operators in it are literal, and
+        # add * for prefix matching.
+        fts_query = '"{}"*'.format(query.replace('"', '""'))
+        c.execute(f'''
+            SELECT {meta_cols} FROM photos p
+            JOIN photos_fts f ON f.rowid = p.id
+            LEFT JOIN users u ON u.id = p.uploader_id
+            WHERE photos_fts MATCH ?
+            ORDER BY p.date DESC, p.created_at DESC
+            LIMIT ? OFFSET ?
+        ''', (fts_query, limit, offset))
+    else:
+        c.execute(f'''
+            SELECT {meta_cols} FROM photos p
+            LEFT JOIN users u ON u.id = p.uploader_id
+            ORDER BY p.date DESC, p.created_at DESC
+            LIMIT ? OFFSET ?
+        ''', (limit, offset))
+    return c.fetchall()
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def photo_image(photo_id):
+    # Cached to skip the SQLite BLOB fetch on reruns. (cache_data returns
+    # a fresh unpickled copy each call, so st.image still hashes the
+    # payload -- the win here is only the avoided query.)
+    conn = get_conn()
+    row = conn.execute("SELECT image_data FROM photos WHERE id = ?", (photo_id,)).fetchone()
+    return row['image_data'] if row else None
+
+def get_people_for_photos(photo_ids):
+    # {photo_id: "a@family.com, b@family.com"} for a whole page in one
+    # query, with the string joining done by GROUP_CONCAT in SQLite.
+    if not photo_ids:
+        return {}
+    conn = get_conn()
+    placeholders = ','.join('?' * len(photo_ids))
+    rows = conn.execute(f'''
+        SELECT pp.photo_id, GROUP_CONCAT(u.email, ', ') AS emails
+        FROM photo_people pp
+        JOIN users u ON u.id = pp.user_id
+        WHERE pp.photo_id IN ({placeholders})
+        GROUP BY pp.photo_id
+    ''', photo_ids).fetchall()
+    return {row['photo_id']: row['emails'] for row in rows}
 
-def resize_image(image, max_size=(800, 800)):
+# Sized for the ~300px grid column so the browser renders thumbnails 1:1
+# instead of CSS-downscaling a full 800px JPEG.
+THUMB_SIZE = (300, 300)
+THUMB_QUALITY = 75
+
+def resize_image(image, max_size=(800, 800), quality=85):
     img = Image.open(io.BytesIO(image))
-    img.thumbnail(max_size)
+    # For JPEG input, let libjpeg downscale in the DCT domain (1/2, 1/4,
+    # 1/8) during decode instead of decoding at full resolution.
+    img.draft("RGB", max_size)
+    img.thumbnail(max_size, Image.BILINEAR)
+    if img.mode != "RGB":  # PNGs may carry an alpha channel JPEG can't save
+        img = img.convert("RGB")
     buffered = io.BytesIO()
-    img.save(buffered, format="JPEG")
+    img.save(buffered, format="JPEG", quality=quality, optimize=False, progressive=False)
     return buffered.getvalue()
 
-def base64_image(image_bytes):
-    return base64.b64encode(image_bytes).decode('utf-8')
+@st.cache_data(max_entries=512)
+def thumb(pid, _raw):
+    # In-memory fallback for photos saved before thumb_data existed;
+    # keyed by photo id so the downscale runs once, not every rerun.
+    return resize_image(_raw, THUMB_SIZE, quality=THUMB_QUALITY)
+
+@st.cache_data(show_spinner=False)
+def resize_image_cached(file_hash, _image_bytes):
+    # Keyed on the file hash so the PIL decode/re-encode runs once per
+    # uploaded file, not on every widget-triggered rerun. The bytes are
+    # passed underscore-prefixed so Streamlit doesn't hash them again.
+    return resize_image(_image_bytes)
 
 # Unique feature: Family Role Map - a simple text-based family tree view
+@st.cache_data(ttl=60)
 def get_family_role_map():
     users = get_all_users()
     role_map = {}
@@ -156,7 +321,7 @@ if not st.session_state.user:
         if st.button("Login"):
             user = authenticate(email, pw)
             if user:
-                st.session_state.user = {'id': user[0], 'email': email, 'role': user[1]}
+                st.session_state.user = {'id': user['id'], 'email': email, 'role': user['role']}
                 st.rerun()
             else:
                 st.error("Invalid credentials")
@@ -168,16 +333,20 @@ if not st.session_state.user:
         new_role = st.selectbox("Your Role in the Family", ["Mum", "Dad", "Son", "Daughter", "Grandparent", "Other"])
         if st.button("Sign Up"):
             if new_email and new_pw and new_role:
-                hashed_pw = hash_password(new_pw)
-                conn = sqlite3.connect(DB_FILE)
+                conn = get_conn()
                 c = conn.cursor()
-                try:
-                    c.execute("INSERT INTO users (email, password, role) VALUES (?, ?, ?)", (new_email, hashed_pw, new_role))
+                with DB_WRITE_LOCK:
+                    c.execute('''
+                        INSERT INTO users (email, password, role) VALUES (?, ?, ?)
+                        ON CONFLICT(email) DO NOTHING RETURNING id
+                    ''', (new_email, hash_password(new_pw), new_role))
+                    created = c.fetchone()
                     conn.commit()
+                if created:
+                    clear_user_caches()
                     st.success("Account created! Please login.")
-                except sqlite3.IntegrityError:
+                else:
                     st.error("Email already exists")
-                conn.close()
             else:
                 st.error("Fill all fields")
 else:
@@ -189,75 +358,70 @@ else:
     # Main app
     st.title("Tanielu Family Story")
     
-    # Upload section
+    # Upload section (a form, so filling in fields doesn't rerun the
+    # script until Save Photo is pressed)
     with st.expander("Upload Photo"):
-        title = st.text_input("Title")
-        desc = st.text_area("Description/Story")
-        date = st.date_input("Date", value=datetime.date.today())
-        loc = st.text_input("Location")
-        users = get_all_users()
-        people_options = {u[1]: u[0] for u in users}  # email: id
-        selected_people = st.multiselect("People in Photo", list(people_options.keys()))
-        people_ids = [people_options[p] for p in selected_people]
-        tags = st.text_input("Tags (comma-separated)")
-        tags_list = [t.strip() for t in tags.split(',')] if tags else []
-        uploaded_file = st.file_uploader("Upload Photo", type=["jpg", "jpeg", "png"])
-        is_collage = st.checkbox("This is a collage (In production, AI will separate photos)")
-        
-        if uploaded_file:
-            image_bytes = uploaded_file.read()
-            if is_collage:
-                st.warning("In production, AI will detect and separate individual photos from this collage.")
-            # Standardize size
-            resized_bytes = resize_image(image_bytes)
-            image_data = base64_image(resized_bytes)
-            if st.button("Save Photo"):
-                save_photo(title, desc, str(date), loc, people_ids, tags_list, st.session_state.user['id'], image_data)
+        with st.form("upload_form", clear_on_submit=True):
+            title = st.text_input("Title")
+            desc = st.text_area("Description/Story")
+            date = st.date_input("Date", value=datetime.date.today())
+            loc = st.text_input("Location")
+            people_options = get_people_options()
+            selected_people = st.multiselect("People in Photo", list(people_options.keys()))
+            tags = st.text_input("Tags (comma-separated)")
+            uploaded_file = st.file_uploader("Upload Photo", type=["jpg", "jpeg", "png"])
+            is_collage = st.checkbox("This is a collage (In production, AI will separate photos)")
+            submitted = st.form_submit_button("Save Photo")
+
+        if submitted:
+            if uploaded_file:
+                if is_collage:
+                    st.warning("In production, AI will detect and separate individual photos from this collage.")
+                people_ids = [people_options[p] for p in selected_people]
+                tags_list = [t.strip() for t in tags.split(',')] if tags else []
+                image_bytes = uploaded_file.read()
+                # Standardize size (cached per file, so a resubmit of the
+                # same file doesn't repeat the JPEG round-trip)
+                file_hash = hashlib.md5(image_bytes).hexdigest()
+                resized_bytes = resize_image_cached(file_hash, image_bytes)
+                save_photo(title, desc, date.isoformat(), loc, people_ids, tags_list, st.session_state.user['id'], resized_bytes)
                 st.success("Photo saved!")
+            else:
+                st.error("Please choose a photo to upload")
+
+    # Search (a form so we query on submit, not on every keystroke rerun)
+    with st.form("search_form"):
+        search_query = st.text_input("Search Memories")
+        st.form_submit_button("Search")
 
-    # Search
-    search_query = st.text_input("Search Memories")
-    if search_query:
-        photos = search_photos(search_query)
-    else:
-        photos = get_all_photos()
-    
     # View modes
     view_mode = st.radio("View Mode", ["Timeline", "Grid"])
+    page = st.number_input("Page", min_value=0, value=0, step=1)
+    photos = get_photos_page(page * PAGE_SIZE, query=search_query or None)
     
     if view_mode == "Timeline":
+        people_by_photo = get_people_for_photos([p['id'] for p in photos])
         for photo in photos:
-            pid, title, desc, date, loc, people_str, tags_str, uploader_id, image_data, created_at = photo
-            uploader = get_user_by_id(uploader_id)
-            people_emails = []
-            if people_str:
-                people_ids = people_str.split(',')
-                for pid in people_ids:
-                    p = get_user_by_id(int(pid))
-                    if p:
-                        people_emails.append(p[0])
-            tags = tags_str.split(',') if tags_str else []
-            with st.expander(f"{title} - {date}"):
-                img_bytes = base64.b64decode(image_data)
-                st.image(img_bytes, use_column_width=True)
-                st.write(f"**Description:** {desc}")
-                st.write(f"**Location:** {loc}")
-                st.write(f"**People:** {', '.join(people_emails)}")
+            tags = photo['tags'].split(',') if photo['tags'] else []
+            with st.expander(f"{photo['title']} - {photo['date']}"):
+                st.image(photo_image(photo['id']), width="stretch")
+                st.write(f"**Description:** {photo['description']}")
+                st.write(f"**Location:** {photo['location']}")
+                st.write(f"**People:** {people_by_photo.get(photo['id'], '')}")
                 st.write(f"**Tags:** {', '.join(tags)}")
-                st.write(f"**Uploaded by:** {uploader[0]} ({uploader[1]})")
-    
+                st.write(f"**Uploaded by:** {photo['email']} ({photo['role']})")
+
     elif view_mode == "Grid":
         cols = st.columns(3)
         for i, photo in enumerate(photos):
-            pid, title, desc, date, loc, people_str, tags_str, uploader_id, image_data, created_at = photo
-            img_bytes = base64.b64decode(image_data)
+            pid = photo['id']
             with cols[i % 3]:
-                st.image(img_bytes, caption=title, use_column_width=True)
+                st.image(photo['thumb_data'] if photo['thumb_data'] else thumb(pid, photo_image(pid)), caption=photo['title'])
                 if st.button("Details", key=f"det_{pid}"):
-                    st.write(f"**Title:** {title}")
-                    st.write(f"**Date:** {date}")
-                    st.write(f"**Description:** {desc}")
-                    st.write(f"**Location:** {loc}")
+                    st.write(f"**Title:** {photo['title']}")
+                    st.write(f"**Date:** {photo['date']}")
+                    st.write(f"**Description:** {photo['description']}")
+                    st.write(f"**Location:** {photo['location']}")
                     # More details can be added in a modal-like expander, but Streamlit limits
 
     # Unique Feature: Family Role Map